@@ -17,6 +17,22 @@ from typing import Any
 
 from ..base import BaseAnalyzer
 
+# Compiled once at import; these run per line over every parsed file.
+_ENV_ASSIGNMENT_RE = re.compile(r"^([A-Z_][A-Z0-9_]*)\s*=\s*(.*)$")
+_ENV_KEY_RE = re.compile(r"^([A-Z_][A-Z0-9_]*)\s*=")
+_COMPOSE_ENV_RE = re.compile(r"^\s*-\s*([A-Z_][A-Z0-9_]*)")
+_CODE_REFERENCE_RES = [
+    re.compile(pattern)
+    for pattern in (
+        # Python: os.getenv("VAR") / os.environ.get("VAR") / os.environ["VAR"]
+        r'os\.getenv\(["\']([A-Z_][A-Z0-9_]*)["\']',
+        r'os\.environ\.get\(["\']([A-Z_][A-Z0-9_]*)["\']',
+        r'os\.environ\[["\']([A-Z_][A-Z0-9_]*)["\']',
+        # JavaScript: process.env.VAR
+        r"process\.env\.([A-Z_][A-Z0-9_]*)",
+    )
+]
+
 
 class EnvironmentDetector(BaseAnalyzer):
     """Detects environment variables and their configurations."""
@@ -81,7 +97,7 @@ class EnvironmentDetector(BaseAnalyzer):
                     continue
 
                 # Parse KEY=value or KEY="value" or KEY='value'
-                match = re.match(r"^([A-Z_][A-Z0-9_]*)\s*=\s*(.*)$", line)
+                match = _ENV_ASSIGNMENT_RE.match(line)
                 if match:
                     key = match.group(1)
                     value = match.group(2).strip().strip('"').strip("'")
@@ -114,7 +130,7 @@ class EnvironmentDetector(BaseAnalyzer):
             if not line or line.startswith("#"):
                 continue
 
-            match = re.match(r"^([A-Z_][A-Z0-9_]*)\s*=", line)
+            match = _ENV_KEY_RE.match(line)
             if match:
                 key = match.group(1)
                 required_vars.add(key)
@@ -149,7 +165,7 @@ class EnvironmentDetector(BaseAnalyzer):
                         continue
 
                     # Parse - KEY=value or - KEY
-                    match = re.match(r"^\s*-\s*([A-Z_][A-Z0-9_]*)", line)
+                    match = _COMPOSE_ENV_RE.match(line)
                     if match:
                         key = match.group(1)
                         if key not in env_vars:
@@ -182,20 +198,8 @@ class EnvironmentDetector(BaseAnalyzer):
             if not content:
                 continue
 
-            # Python: os.getenv("VAR") or os.environ.get("VAR")
-            python_patterns = [
-                r'os\.getenv\(["\']([A-Z_][A-Z0-9_]*)["\']',
-                r'os\.environ\.get\(["\']([A-Z_][A-Z0-9_]*)["\']',
-                r'os\.environ\[["\']([A-Z_][A-Z0-9_]*)["\']',
-            ]
-
-            # JavaScript: process.env.VAR
-            js_patterns = [
-                r"process\.env\.([A-Z_][A-Z0-9_]*)",
-            ]
-
-            for pattern in python_patterns + js_patterns:
-                matches = re.findall(pattern, content)
+            for pattern in _CODE_REFERENCE_RES:
+                matches = pattern.findall(content)
                 for var_name in matches:
                     if var_name not in env_vars:
                         optional_vars.add(var_name)
@@ -34,6 +34,12 @@ from typing import Any
 try:
     import yaml
 
+    try:
+        # libyaml C bindings are roughly an order of magnitude faster
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
@@ -411,7 +417,7 @@ class CIDiscovery:
         """Parse YAML content, with fallback to basic parsing if yaml not available."""
         if HAS_YAML:
             try:
-                return yaml.safe_load(content)
+                return yaml.load(content, Loader=_YamlLoader)
             except Exception:
                 return None
 
@@ -7,6 +7,7 @@ CLI commands for building specs and handling the main build flow.
 
 import asyncio
 import sys
+import traceback
 from pathlib import Path
 
 # Ensure parent directory is in path for imports (before other imports)
@@ -309,8 +310,6 @@ def handle_build_command(
     except Exception as e:
         print(f"\nFatal error: {e}")
         if verbose:
-            import traceback
-
             traceback.print_exc()
         sys.exit(1)
 
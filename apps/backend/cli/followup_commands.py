@@ -8,6 +8,7 @@ CLI commands for adding follow-up tasks to completed specs.
 import asyncio
 import json
 import sys
+import traceback
 from pathlib import Path
 
 # Ensure parent directory is in path for imports (before other imports)
@@ -369,7 +370,5 @@ def handle_followup_command(
         print()
         print(error(f"{icon(Icons.ERROR)} Follow-up planning error: {e}"))
         if verbose:
-            import traceback
-
             traceback.print_exc()
         sys.exit(1)
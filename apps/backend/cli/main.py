@@ -16,18 +16,6 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 
-from .batch_commands import (
-    handle_batch_cleanup_command,
-    handle_batch_create_command,
-    handle_batch_status_command,
-)
-from .build_commands import handle_build_command
-from .followup_commands import handle_followup_command
-from .qa_commands import (
-    handle_qa_command,
-    handle_qa_status_command,
-    handle_review_status_command,
-)
 from .spec_commands import print_specs_list
 from .utils import (
     DEFAULT_MODEL,
@@ -36,13 +24,9 @@ from .utils import (
     print_banner,
     setup_environment,
 )
-from .workspace_commands import (
-    handle_cleanup_worktrees_command,
-    handle_discard_command,
-    handle_list_worktrees_command,
-    handle_merge_command,
-    handle_review_command,
-)
+
+# Command handler modules are imported lazily at their dispatch sites below;
+# they pull in the agent/merge/QA stacks, which --help and --list never need.
 
 
 def parse_args() -> argparse.Namespace:
@@ -288,24 +272,34 @@ def main() -> None:
 
     # Handle --list-worktrees command
     if args.list_worktrees:
+        from .workspace_commands import handle_list_worktrees_command
+
         handle_list_worktrees_command(project_dir)
         return
 
     # Handle --cleanup-worktrees command
     if args.cleanup_worktrees:
+        from .workspace_commands import handle_cleanup_worktrees_command
+
         handle_cleanup_worktrees_command(project_dir)
         return
 
     # Handle batch commands
     if args.batch_create:
+        from .batch_commands import handle_batch_create_command
+
         handle_batch_create_command(args.batch_create, str(project_dir))
         return
 
     if args.batch_status:
+        from .batch_commands import handle_batch_status_command
+
         handle_batch_status_command(str(project_dir))
         return
 
     if args.batch_cleanup:
+        from .batch_commands import handle_batch_cleanup_command
+
         handle_batch_cleanup_command(str(project_dir), dry_run=not args.no_dry_run)
         return
 
@@ -347,6 +341,8 @@ def main() -> None:
         return
 
     if args.merge:
+        from .workspace_commands import handle_merge_command
+
         success = handle_merge_command(
             project_dir,
             spec_dir.name,
@@ -358,23 +354,33 @@ def main() -> None:
         return
 
     if args.review:
+        from .workspace_commands import handle_review_command
+
         handle_review_command(project_dir, spec_dir.name)
         return
 
     if args.discard:
+        from .workspace_commands import handle_discard_command
+
         handle_discard_command(project_dir, spec_dir.name)
         return
 
     # Handle QA commands
     if args.qa_status:
+        from .qa_commands import handle_qa_status_command
+
         handle_qa_status_command(spec_dir)
         return
 
     if args.review_status:
+        from .qa_commands import handle_review_status_command
+
         handle_review_status_command(spec_dir)
         return
 
     if args.qa:
+        from .qa_commands import handle_qa_command
+
         handle_qa_command(
             project_dir=project_dir,
             spec_dir=spec_dir,
@@ -385,6 +391,8 @@ def main() -> None:
 
     # Handle --followup command
     if args.followup:
+        from .followup_commands import handle_followup_command
+
         handle_followup_command(
             project_dir=project_dir,
             spec_dir=spec_dir,
@@ -394,6 +402,8 @@ def main() -> None:
         return
 
     # Normal build flow
+    from .build_commands import handle_build_command
+
     handle_build_command(
         project_dir=project_dir,
         spec_dir=spec_dir,
@@ -7,6 +7,7 @@ CLI commands for workspace management (merge, review, discard, list, cleanup)
 
 import subprocess
 import sys
+import traceback
 from pathlib import Path
 
 # Ensure parent directory is in path for imports (before other imports)
@@ -514,8 +515,6 @@ def _check_git_merge_conflicts(project_dir: Path, spec_name: str) -> dict:
 
     except Exception as e:
         debug_error(MODULE, f"Error checking git conflicts: {e}")
-        import traceback
-
         debug_verbose(MODULE, "Exception traceback", traceback=traceback.format_exc())
 
     return result
@@ -788,8 +787,6 @@ def handle_merge_preview_command(
 
     except Exception as e:
         debug_error(MODULE, "Merge preview failed", error=str(e))
-        import traceback
-
         debug_verbose(MODULE, "Exception traceback", traceback=traceback.format_exc())
         return {
             "success": False,
@@ -10,6 +10,7 @@ Gathers project context including:
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -103,18 +104,23 @@ class ProjectAnalyzer:
         # Get kanban context if enabled
         if self.include_kanban:
             specs_dir = self.project_dir / ".auto-claude" / "specs"
-            if specs_dir.exists():
-                for spec_dir in specs_dir.iterdir():
-                    if spec_dir.is_dir():
-                        spec_file = spec_dir / "spec.md"
-                        if spec_file.exists():
-                            # Extract title from spec
-                            content = spec_file.read_text()
-                            lines = content.split("\n")
-                            for line in lines:
-                                if line.startswith("# "):
-                                    context["planned_features"].append(line[2:].strip())
-                                    break
+            try:
+                spec_entries = list(os.scandir(specs_dir))
+            except OSError:
+                spec_entries = []
+            for entry in spec_entries:
+                if not entry.is_dir():
+                    continue
+                try:
+                    # Extract title from spec; only the header lines are
+                    # needed, so stop reading at the first H1
+                    with open(Path(entry.path, "spec.md"), encoding="utf-8") as f:
+                        for line in f:
+                            if line.startswith("# "):
+                                context["planned_features"].append(line[2:].strip())
+                                break
+                except OSError:
+                    continue
 
         # Remove duplicates from planned features
         context["planned_features"] = list(set(context["planned_features"]))
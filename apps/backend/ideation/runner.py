@@ -29,6 +29,10 @@ from .types import IdeationPhaseResult
 # Configuration
 MAX_RETRIES = 3
 
+# Cap on simultaneously running ideation agents; unbounded fan-out trips
+# provider rate limits and the resulting retries erase the parallelism gain
+MAX_CONCURRENT_IDEATION = 4
+
 
 class IdeationOrchestrator:
     """Orchestrates the ideation creation process."""
@@ -173,12 +177,17 @@ class IdeationOrchestrator:
             "progress",
         )
 
-        # Create tasks for all enabled types
+        # Create tasks for all enabled types, bounded by a semaphore
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_IDEATION)
+
+        async def run_bounded(ideation_type: str):
+            async with semaphore:
+                return await self.output_streamer.stream_ideation_result(
+                    ideation_type, self.phase_executor, MAX_RETRIES
+                )
+
         ideation_tasks = [
-            self.output_streamer.stream_ideation_result(
-                ideation_type, self.phase_executor, MAX_RETRIES
-            )
-            for ideation_type in self.enabled_types
+            run_bounded(ideation_type) for ideation_type in self.enabled_types
         ]
 
         # Run all ideation types concurrently
@@ -8,6 +8,8 @@ tracking, status management, and follow-up capabilities.
 """
 
 import json
+import os
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -108,8 +110,20 @@ class ImplementationPlan:
         self.update_status_from_subtasks()
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        # Write to temp file first, then atomic rename so concurrent readers
+        # (UI, QA loop) never see a partially written plan
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Clean up temp file on failure
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
 
     def update_status_from_subtasks(self):
         """Update overall status and planStatus based on subtask completion state.
@@ -12,20 +12,30 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
 from .file_timeline import FileTimelineTracker
 
+_ROOT_MARKERS = frozenset({".auto-claude", ".git"})
+
 
 def find_project_root() -> Path:
     """Find the project root by looking for .auto-claude or .git directory."""
     current = Path.cwd()
 
-    # Walk up until we find .auto-claude or .git
+    # Walk up until we find .auto-claude or .git; one directory read per
+    # level instead of a stat per marker, stopping at mount boundaries.
     while current != current.parent:
-        if (current / ".auto-claude").exists() or (current / ".git").exists():
-            return current
+        try:
+            with os.scandir(current) as entries:
+                if any(entry.name in _ROOT_MARKERS for entry in entries):
+                    return current
+        except OSError:
+            break
+        if os.path.ismount(current):
+            break
         current = current.parent
 
     # Default to cwd
@@ -2,23 +2,23 @@
 Utility functions for implementation planner.
 """
 
+import re
+
 from implementation_plan import Verification, VerificationType
 
 from .models import PlannerContext
 
+# First H1, with common "Specification:"/"Spec:"/"Feature:" prefixes stripped
+_SPEC_TITLE_RE = re.compile(r"^#\s+(?:(?:Specification|Spec|Feature):\s*)*(.+?)\s*$")
+
 
 def extract_feature_name(context: PlannerContext) -> str:
     """Extract feature name from spec."""
     # Try to find title in spec
-    lines = context.spec_content.split("\n")
-    for line in lines[:10]:
-        if line.startswith("# "):
-            title = line[2:].strip()
-            # Remove common prefixes
-            for prefix in ["Specification:", "Spec:", "Feature:"]:
-                if title.startswith(prefix):
-                    title = title[len(prefix) :].strip()
-            return title
+    for line in context.spec_content.split("\n")[:10]:
+        match = _SPEC_TITLE_RE.match(line)
+        if match:
+            return match.group(1)
 
     return "Unnamed Feature"
 
@@ -8,6 +8,7 @@ Coordinates stack detection, framework detection, and structure analysis.
 
 import hashlib
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -166,22 +167,34 @@ class ProjectAnalyzer:
         # If no config files found, hash the project directory structure
         # to at least detect when files are added/removed
         if files_found == 0:
-            # Count source files as a proxy for project structure
+            # Count source files as a proxy for project structure; one tree
+            # walk tallies every extension instead of a recursive glob each
             source_exts = [
-                "*.py",
-                "*.js",
-                "*.ts",
-                "*.go",
-                "*.rs",
-                "*.dart",
-                "*.cs",
-                "*.swift",
-                "*.kt",
-                "*.java",
+                ".py",
+                ".js",
+                ".ts",
+                ".go",
+                ".rs",
+                ".dart",
+                ".cs",
+                ".swift",
+                ".kt",
+                ".java",
             ]
-            for ext in source_exts:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
-                hasher.update(f"{ext}:{count}".encode())
+            counts = dict.fromkeys(source_exts, 0)
+            for _root, dirs, files in os.walk(self.project_dir):
+                # Unlike the old recursive glob, hidden directories and
+                # dotfiles (.git, .venv, .auto-claude, ...) are deliberately
+                # excluded from the counts - they aren't user source and
+                # would make the fingerprint churn. This changes the hash
+                # inputs once, forcing a single re-analysis on upgrade.
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                for name in files:
+                    suffix = os.path.splitext(name)[1]
+                    if suffix in counts and not name.startswith("."):
+                        counts[suffix] += 1
+            for ext, count in counts.items():
+                hasher.update(f"*{ext}:{count}".encode())
             # Also include the project directory name for uniqueness
             hasher.update(self.project_dir.name.encode())
 
@@ -11,6 +11,11 @@ from pathlib import Path
 
 from .config_parser import ConfigParser
 
+# Leading package-name extractor for "package>=1.0"-style dependency
+# specifiers; compiled once since it runs per line of every parsed
+# dependency file.
+_DEP_NAME_RE = re.compile(r"^([a-zA-Z0-9_-]+)")
+
 
 class FrameworkDetector:
     """Detects frameworks from project dependencies."""
@@ -136,7 +141,7 @@ class FrameworkDetector:
             if "project" in toml:
                 for dep in toml["project"].get("dependencies", []):
                     # Parse "package>=1.0" style
-                    match = re.match(r"^([a-zA-Z0-9_-]+)", dep)
+                    match = _DEP_NAME_RE.match(dep)
                     if match:
                         python_deps.add(match.group(1).lower())
 
@@ -144,7 +149,7 @@ class FrameworkDetector:
             if "project" in toml and "optional-dependencies" in toml["project"]:
                 for group_deps in toml["project"]["optional-dependencies"].values():
                     for dep in group_deps:
-                        match = re.match(r"^([a-zA-Z0-9_-]+)", dep)
+                        match = _DEP_NAME_RE.match(dep)
                         if match:
                             python_deps.add(match.group(1).lower())
 
@@ -158,8 +163,8 @@ class FrameworkDetector:
             if content:
                 for line in content.splitlines():
                     line = line.strip()
-                    if line and not line.startswith("#") and not line.startswith("-"):
-                        match = re.match(r"^([a-zA-Z0-9_-]+)", line)
+                    if line and not line.startswith(("#", "-")):
+                        match = _DEP_NAME_RE.match(line)
                         if match:
                             python_deps.add(match.group(1).lower())
 
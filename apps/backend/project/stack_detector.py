@@ -6,11 +6,98 @@ Detects programming languages, package managers, databases,
 infrastructure tools, and cloud providers from project files.
 """
 
+import os
 from pathlib import Path
 
 from .config_parser import ConfigParser
 from .models import TechnologyStack
 
+# Language detection tables: one tree walk looks up every filename here
+# instead of issuing a recursive glob per language pattern.
+_LANGUAGE_ORDER = (
+    "python",
+    "javascript",
+    "typescript",
+    "rust",
+    "go",
+    "ruby",
+    "php",
+    "java",
+    "kotlin",
+    "scala",
+    "csharp",
+    "c",
+    "cpp",
+    "elixir",
+    "swift",
+    "dart",
+)
+
+_EXT_TO_LANGUAGE = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".rs": "rust",
+    ".go": "go",
+    ".rb": "ruby",
+    ".php": "php",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".scala": "scala",
+    ".cs": "csharp",
+    ".csproj": "csharp",
+    ".sln": "csharp",
+    ".c": "c",
+    ".h": "c",
+    ".cpp": "cpp",
+    ".hpp": "cpp",
+    ".cc": "cpp",
+    ".ex": "elixir",
+    ".swift": "swift",
+    ".dart": "dart",
+}
+
+# Marker files are only honored at the project root (like the previous
+# root-level file_exists() checks); a nested docs/Makefile or vendored
+# Gemfile must not widen the detected stack, which feeds the dynamic
+# command allowlist.
+_MARKER_TO_LANGUAGE = {
+    "pyproject.toml": "python",
+    "requirements.txt": "python",
+    "setup.py": "python",
+    "Pipfile": "python",
+    "package.json": "javascript",
+    "tsconfig.json": "typescript",
+    "Cargo.toml": "rust",
+    "go.mod": "go",
+    "Gemfile": "ruby",
+    "composer.json": "php",
+    "pom.xml": "java",
+    "build.gradle": "java",
+    "build.sbt": "scala",
+    "CMakeLists.txt": "c",
+    "Makefile": "c",
+    "mix.exs": "elixir",
+    "Package.swift": "swift",
+    "pubspec.yaml": "dart",
+}
+
+# Vendor/build directories that would dominate the walk without ever
+# changing the result.
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "venv",
+        ".venv",
+        "target",
+        "dist",
+        "build",
+        "__pycache__",
+    }
+)
+
 
 class StackDetector:
     """Detects technology stack from project structure."""
@@ -43,79 +130,26 @@ class StackDetector:
         return self.stack
 
     def detect_languages(self) -> None:
-        """Detect programming languages used."""
-        # Python
-        if self.parser.file_exists(
-            "*.py",
-            "**/*.py",
-            "pyproject.toml",
-            "requirements.txt",
-            "setup.py",
-            "Pipfile",
-        ):
-            self.stack.languages.append("python")
-
-        # JavaScript
-        if self.parser.file_exists("*.js", "**/*.js", "package.json"):
-            self.stack.languages.append("javascript")
-
-        # TypeScript
-        if self.parser.file_exists(
-            "*.ts", "*.tsx", "**/*.ts", "**/*.tsx", "tsconfig.json"
-        ):
-            self.stack.languages.append("typescript")
-
-        # Rust
-        if self.parser.file_exists("Cargo.toml", "*.rs", "**/*.rs"):
-            self.stack.languages.append("rust")
-
-        # Go
-        if self.parser.file_exists("go.mod", "*.go", "**/*.go"):
-            self.stack.languages.append("go")
-
-        # Ruby
-        if self.parser.file_exists("Gemfile", "*.rb", "**/*.rb"):
-            self.stack.languages.append("ruby")
-
-        # PHP
-        if self.parser.file_exists("composer.json", "*.php", "**/*.php"):
-            self.stack.languages.append("php")
+        """Detect programming languages used.
 
-        # Java
-        if self.parser.file_exists("pom.xml", "build.gradle", "*.java", "**/*.java"):
-            self.stack.languages.append("java")
-
-        # Kotlin
-        if self.parser.file_exists("*.kt", "**/*.kt"):
-            self.stack.languages.append("kotlin")
-
-        # Scala
-        if self.parser.file_exists("build.sbt", "*.scala", "**/*.scala"):
-            self.stack.languages.append("scala")
-
-        # C#
-        if self.parser.file_exists("*.csproj", "*.sln", "*.cs", "**/*.cs"):
-            self.stack.languages.append("csharp")
-
-        # C/C++
-        if self.parser.file_exists(
-            "*.c", "*.h", "**/*.c", "**/*.h", "CMakeLists.txt", "Makefile"
-        ):
-            self.stack.languages.append("c")
-        if self.parser.file_exists("*.cpp", "*.hpp", "*.cc", "**/*.cpp", "**/*.hpp"):
-            self.stack.languages.append("cpp")
-
-        # Elixir
-        if self.parser.file_exists("mix.exs", "*.ex", "**/*.ex"):
-            self.stack.languages.append("elixir")
-
-        # Swift
-        if self.parser.file_exists("Package.swift", "*.swift", "**/*.swift"):
-            self.stack.languages.append("swift")
-
-        # Dart/Flutter
-        if self.parser.file_exists("pubspec.yaml", "*.dart", "**/*.dart"):
-            self.stack.languages.append("dart")
+        A single pruned os.walk replaces the previous recursive glob per
+        language, which rescanned the whole tree ~20 times.
+        """
+        found: set[str] = set()
+        top_level = True
+        for _root, dirs, files in os.walk(self.project_dir, followlinks=False):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            for name in files:
+                language = _EXT_TO_LANGUAGE.get(os.path.splitext(name)[1])
+                if language is None and top_level:
+                    language = _MARKER_TO_LANGUAGE.get(name)
+                if language:
+                    found.add(language)
+            top_level = False
+            if len(found) == len(_LANGUAGE_ORDER):
+                break
+
+        self.stack.languages.extend(lang for lang in _LANGUAGE_ORDER if lang in found)
 
     def detect_package_managers(self) -> None:
         """Detect package managers used."""
@@ -419,11 +419,9 @@ class OnboardingManager:
             state_item.description = f"Would create {self.state_dir}"
         else:
             try:
-                self.state_dir.mkdir(parents=True, exist_ok=True)
-                (self.state_dir / "pr").mkdir(exist_ok=True)
-                (self.state_dir / "issues").mkdir(exist_ok=True)
-                (self.state_dir / "autofix").mkdir(exist_ok=True)
-                (self.state_dir / "audit").mkdir(exist_ok=True)
+                # parents=True creates state_dir itself on the first pass
+                for subdir in ("pr", "issues", "autofix", "audit"):
+                    (self.state_dir / subdir).mkdir(parents=True, exist_ok=True)
                 state_item.completed = True
                 state_item.completed_at = datetime.now(timezone.utc)
             except Exception as e:
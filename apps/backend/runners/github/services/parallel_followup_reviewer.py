@@ -131,10 +131,11 @@ class ParallelFollowupReviewer:
         prompt_file = (
             Path(__file__).parent.parent.parent.parent / "prompts" / "github" / filename
         )
-        if prompt_file.exists():
+        try:
             return prompt_file.read_text(encoding="utf-8")
-        logger.warning(f"Prompt file not found: {prompt_file}")
-        return ""
+        except FileNotFoundError:
+            logger.warning(f"Prompt file not found: {prompt_file}")
+            return ""
 
     def _define_specialist_agents(self) -> dict[str, AgentDefinition]:
         """
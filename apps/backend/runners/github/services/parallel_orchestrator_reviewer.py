@@ -117,10 +117,11 @@ class ParallelOrchestratorReviewer:
         prompt_file = (
             Path(__file__).parent.parent.parent.parent / "prompts" / "github" / filename
         )
-        if prompt_file.exists():
+        try:
             return prompt_file.read_text(encoding="utf-8")
-        logger.warning(f"Prompt file not found: {prompt_file}")
-        return ""
+        except FileNotFoundError:
+            logger.warning(f"Prompt file not found: {prompt_file}")
+            return ""
 
     def _create_pr_worktree(self, head_sha: str, pr_number: int) -> Path:
         """Create a temporary worktree at the PR head commit.
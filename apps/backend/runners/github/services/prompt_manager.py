@@ -297,9 +297,10 @@ Output JSON array:
     def get_pr_review_prompt(self) -> str:
         """Get the main PR review prompt."""
         prompt_file = self.prompts_dir / "pr_reviewer.md"
-        if prompt_file.exists():
+        try:
             return prompt_file.read_text(encoding="utf-8")
-        return self._get_default_pr_review_prompt()
+        except FileNotFoundError:
+            return self._get_default_pr_review_prompt()
 
     def _get_default_pr_review_prompt(self) -> str:
         """Default PR review prompt if file doesn't exist."""
@@ -337,9 +338,10 @@ Be specific and actionable. Focus on significant issues, not nitpicks.
     def get_followup_review_prompt(self) -> str:
         """Get the follow-up PR review prompt."""
         prompt_file = self.prompts_dir / "pr_followup.md"
-        if prompt_file.exists():
+        try:
             return prompt_file.read_text(encoding="utf-8")
-        return self._get_default_followup_review_prompt()
+        except FileNotFoundError:
+            return self._get_default_followup_review_prompt()
 
     def _get_default_followup_review_prompt(self) -> str:
         """Default follow-up review prompt if file doesn't exist."""
@@ -379,9 +381,10 @@ Output JSON:
     def get_triage_prompt(self) -> str:
         """Get the issue triage prompt."""
         prompt_file = self.prompts_dir / "issue_triager.md"
-        if prompt_file.exists():
+        try:
             return prompt_file.read_text(encoding="utf-8")
-        return self._get_default_triage_prompt()
+        except FileNotFoundError:
+            return self._get_default_triage_prompt()
 
     def _get_default_triage_prompt(self) -> str:
         """Default triage prompt if file doesn't exist."""
@@ -141,6 +141,12 @@ class ServiceOrchestrator:
             # Try to import yaml
             import yaml
 
+            try:
+                # Prefer the libyaml C loader when available
+                from yaml import CSafeLoader as yaml_loader
+            except ImportError:
+                from yaml import SafeLoader as yaml_loader
+
             HAS_YAML = True
         except ImportError:
             HAS_YAML = False
@@ -168,7 +174,7 @@ class ServiceOrchestrator:
 
         try:
             with open(self._compose_file, encoding="utf-8") as f:
-                compose_data = yaml.safe_load(f)
+                compose_data = yaml.load(f, Loader=yaml_loader)
 
             services = compose_data.get("services", {})
             for name, config in services.items():
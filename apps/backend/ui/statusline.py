@@ -33,6 +33,7 @@ ccstatusline Configuration:
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -48,23 +49,22 @@ from ui import (
     supports_unicode,
 )
 
+_ROOT_MARKERS = frozenset({".auto-claude", ".auto-claude-status"})
+
 
 def find_project_root() -> Path:
     """Find the project root by looking for .auto-claude or .auto-claude-status."""
     cwd = Path.cwd()
 
-    # Check current directory - prioritize .auto-claude (installed instance)
-    if (cwd / ".auto-claude").exists():
-        return cwd
-    if (cwd / ".auto-claude-status").exists():
-        return cwd
-
-    # Walk up to find project root
-    for parent in cwd.parents:
-        if (parent / ".auto-claude").exists():
-            return parent
-        if (parent / ".auto-claude-status").exists():
-            return parent
+    # One directory read per level instead of a stat call per marker -
+    # the statusline runs on every refresh, so keep syscalls minimal.
+    for candidate in (cwd, *cwd.parents):
+        try:
+            with os.scandir(candidate) as entries:
+                if any(entry.name in _ROOT_MARKERS for entry in entries):
+                    return candidate
+        except OSError:
+            continue
 
     return cwd
 
@@ -120,6 +120,31 @@ class TestLanguageDetection:
 
         assert "go" in analyzer.profile.detected_stack.languages
 
+    def test_nested_marker_files_are_ignored(self, temp_dir: Path):
+        """Marker files below the project root must not widen the stack.
+
+        A Sphinx-style docs/Makefile would otherwise pull the whole C
+        toolchain into the dynamic command allowlist.
+        """
+        (temp_dir / "app.py").write_text("print('hello')")
+        (temp_dir / "docs").mkdir()
+        (temp_dir / "docs" / "Makefile").write_text("html:\n")
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._detect_languages()
+
+        assert "python" in analyzer.profile.detected_stack.languages
+        assert "c" not in analyzer.profile.detected_stack.languages
+
+    def test_root_marker_file_detects_language(self, temp_dir: Path):
+        """Marker files at the project root still count."""
+        (temp_dir / "Makefile").write_text("all:\n\tgcc main.c\n")
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._detect_languages()
+
+        assert "c" in analyzer.profile.detected_stack.languages
+
     def test_detects_multiple_languages(self, temp_dir: Path):
         """Detects multiple languages in same project."""
         (temp_dir / "app.py").write_text("print('hello')")